@@ -2,14 +2,31 @@
 """Interactive JSON diff tool that periodically fetches and compares JSON from URLs."""
 
 import argparse
+import asyncio
+import copy
+import difflib
+import io
+import itertools
 import json
+import logging
+import os
+import queue
+import re
+import sys
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional, Union
 from urllib.parse import urlparse
 
-import requests
+import httpx
+import ijson
+import jsonpatch
+import orjson
+import xxhash
 from deepdiff import DeepDiff
+from jsonpointer import resolve_pointer
 from rich import box
 from rich.console import Console, Group
 from rich.panel import Panel
@@ -19,6 +36,108 @@ from rich.text import Text
 
 console = Console()
 
+# DeepDiff logs a warning when it hits max_diffs; that is reported in the
+# Changes Summary instead of as a stray line between the panels
+logging.getLogger("deepdiff").setLevel(logging.ERROR)
+
+# Cap on the differences DeepDiff collects for the side-by-side summary
+MAX_DIFFS = 10_000
+
+# Runs of unchanged lines longer than this are collapsed in the side-by-side view
+COLLAPSE_EQUAL_LINES = 5
+
+# Size of the chunks a response body is read in
+CHUNK_SIZE = 64 * 1024
+
+
+class _HashingReader:
+    """Async file-like wrapper that hashes the chunks read through it."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self.hasher = xxhash.xxh3_64()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+        self.hasher.update(chunk)
+        return chunk
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create an HTTP client with a keep-alive pool shareable by watchers.
+
+    Returns:
+        Async HTTP client
+    """
+    # HTTP/2 is negotiated via ALPN, so watchers polling the same host
+    # multiplex over one connection; HTTP/1.1 servers use the keep-alive pool
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        retries=2,
+        http2=True,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        follow_redirects=True,
+    )
+
+
+# Data shapes with a specialized differ, selectable with --schema
+SCHEMAS = ("list-by-key",)
+
+# Output formats: Rich panels, or JSON Patch documents written to stdout
+FORMATS = ("rich", "json", "ndjson")
+
+
+def diff_list_by_key(prev: list, curr: list, key: str) -> Optional[tuple]:
+    """Diff two lists of records matched by a key field.
+
+    Indexes both sides by key, so the cost is linear in the number of
+    records and nothing is compared beyond record equality.
+
+    Args:
+        prev: Previous list of records
+        curr: Current list of records
+        key: Field identifying a record
+
+    Returns:
+        (added, removed, changed) lists, changed holding (old, new) record
+        pairs, or None if either list is not made of records with unique,
+        hashable values for key
+    """
+    try:
+        prev_by_key = {record[key]: record for record in prev}
+        curr_by_key = {record[key]: record for record in curr}
+    except (KeyError, TypeError):
+        return None
+    if len(prev_by_key) != len(prev) or len(curr_by_key) != len(curr):
+        return None
+
+    added = [record for k, record in curr_by_key.items() if k not in prev_by_key]
+    removed = [record for k, record in prev_by_key.items() if k not in curr_by_key]
+    changed = [
+        (prev_by_key[k], record)
+        for k, record in curr_by_key.items()
+        if k in prev_by_key and prev_by_key[k] != record
+    ]
+    return added, removed, changed
+
+
+# Returned by fetch_json when the server reports the payload is unchanged
+_UNCHANGED = object()
+
+# Tells the cache writer thread to exit
+_STOP = object()
+
+# Returned by filter_json when --max-nodes ran out before the search finished
+_BUDGET_EXCEEDED = object()
+
 
 class JSONDiffWatcher:
     """Watch and diff JSON from a URL with filtering and colored output."""
@@ -32,6 +151,12 @@ class JSONDiffWatcher:
         filter_value: Optional[str] = None,
         show_only_diffs: bool = False,
         headers: Optional[dict] = None,
+        max_backoff: int = 10,
+        long_poll: bool = False,
+        client: Optional[httpx.AsyncClient] = None,
+        schema: Optional[str] = None,
+        max_nodes: Optional[int] = None,
+        output_format: str = "rich",
     ):
         """Initialize the JSON diff watcher.
 
@@ -43,36 +168,171 @@ class JSONDiffWatcher:
             filter_value: Value to match for filter_key
             show_only_diffs: If True, show only the differences
             headers: Optional HTTP headers to send with requests
+            max_backoff: Cap on the interval multiplier while nothing changes
+            long_poll: If True, ask the server to hold requests until changes
+            client: HTTP client to share with other watchers; a private one
+                is created if not given
+            schema: Known shape of the filtered data to diff it faster;
+                'list-by-key' matches list records by filter_key
+            max_nodes: Cap on the nodes visited when searching nested data
+                for filter_key
+            output_format: 'rich' for colored panels, 'json' for one
+                {"url", "seq", "patch"} record per change on stdout, 'ndjson'
+                for one patch operation per line tagged with "url" and "seq"
+
+        Raises:
+            ValueError: If filter_path contains an invalid list index, or
+                schema is unknown or lacks the filter_key it needs
         """
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'")
+        if schema is not None and schema not in SCHEMAS:
+            raise ValueError(f"Unknown schema '{schema}'")
+        if schema == "list-by-key" and not filter_key:
+            raise ValueError("Schema 'list-by-key' requires a filter key")
+
         self.url = url
         self.interval = interval
         self.filter_path = filter_path
         self.filter_key = filter_key
         self.filter_value = filter_value
         self.show_only_diffs = show_only_diffs
+        self.schema = schema
+        self.max_nodes = max_nodes
+        # Only warn the first time the node budget runs out
+        self._budget_warned = False
+        self.output_format = output_format
+        # Number of changes written in json/ndjson mode
+        self._seq = 0
+        self._path_ops = self._compile_path(filter_path) if filter_path else []
+        self._stream_prefix = self._ijson_prefix(self._path_ops)
         self.headers = headers or {}
+        self.long_poll = long_poll
         self.previous_data: Optional[Any] = None
         self.previous_filtered: Optional[Any] = None
-        self.storage_file = (
-            Path.home()
-            / ".jsondiff_cache"
-            / f"{urlparse(url).netloc.replace('.', '_')}.json"
-        )
-
-    def fetch_json(self) -> Optional[Any]:
+        # Pretty-printed previous_filtered, kept to avoid re-serializing it
+        self._previous_pretty: Optional[str] = None
+        parsed_url = urlparse(url)
+        cache_name = parsed_url.netloc.replace(".", "_")
+        # Keep URLs on the same host apart when watching several of them
+        url_path = re.sub(r"[^A-Za-z0-9]+", "_", parsed_url.path).strip("_")
+        if url_path:
+            cache_name = f"{cache_name}_{url_path}"
+        # The readable part drops the query string, so a short hash of the
+        # full URL keeps ?page=1 and ?page=2 (and their .tmp files) apart
+        url_hash = xxhash.xxh3_64_hexdigest(url.encode())[:8]
+        cache_name = f"{cache_name}_{url_hash}"
+        if self._stream_prefix is not None:
+            # Streamed snapshots hold only the selected list, not the whole
+            # document, so they must not share a file with full snapshots
+            stream_name = re.sub(r"[^A-Za-z0-9]+", "_", self._stream_prefix)
+            cache_name = f"{cache_name}__stream_{stream_name}".rstrip("_")
+        self.storage_file = Path.home() / ".jsondiff_cache" / f"{cache_name}.json"
+
+        # Reuse keep-alive connections across polls instead of paying a
+        # fresh TCP/TLS handshake every interval
+        self._owns_client = client is None
+        self._client = client if client is not None else create_client()
+
+        # The cache file is written by a background thread. A snapshot still
+        # waiting to be written is replaced by newer data, not queued behind
+        self._write_q: queue.Queue = queue.Queue(maxsize=1)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+        # Validators from the last response, used for conditional GETs
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        # Hash of the last response body, for servers without validators
+        self._prev_hash: Optional[int] = None
+
+        # Polling slows down exponentially while the data stays unchanged
+        self._idle_multiplier = 1
+        self._max_multiplier = max(1, max_backoff)
+        # Whether the server actually held the last long-poll request
+        self._server_waited = False
+
+    async def fetch_json(self) -> Optional[Any]:
         """Fetch JSON from the URL.
 
         Returns:
-            Parsed JSON data or None if fetch fails
+            Parsed JSON data, _UNCHANGED if the server answered 304 Not
+            Modified or sent the same body as last time, or None if fetch
+            fails
         """
+        cond_headers = {}
+        if self._etag is not None:
+            cond_headers["If-None-Match"] = self._etag
+        if self._last_modified is not None:
+            cond_headers["If-Modified-Since"] = self._last_modified
+
+        self._server_waited = False
+        wait = 0
+        timeout = httpx.USE_CLIENT_DEFAULT
+        if self.long_poll:
+            # Let the server hold the request for up to the longest idle
+            # interval, and leave some headroom for its reply
+            wait = max(1, round(self.interval * self._max_multiplier))
+            cond_headers["Prefer"] = f"wait={wait}"
+            timeout = httpx.Timeout(wait + 10, connect=5.0)
+
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            started = time.monotonic()
+            async with self._client.stream(
+                "GET",
+                self.url,
+                headers={**self.headers, **cond_headers},
+                timeout=timeout,
+            ) as response:
+                if self.long_poll:
+                    # Most servers ignore Prefer: wait and answer at once
+                    self._server_waited = (
+                        "wait" in response.headers.get("Preference-Applied", "")
+                        or time.monotonic() - started >= 0.9 * wait
+                    )
+                if response.status_code == 304:
+                    return _UNCHANGED
+                response.raise_for_status()
+                # Keep the validators even if the body turns out unchanged, or
+                # a server that rotates them would never answer 304 again
+                self._etag = response.headers.get("ETag")
+                self._last_modified = response.headers.get("Last-Modified")
+                # Hash the body while it is being read, so it is only walked
+                # once before parsing
+                chunks = response.aiter_bytes(CHUNK_SIZE)
+                if self._stream_prefix is not None:
+                    # Only materialize the selected list, not the whole
+                    # document; like _apply_path_filter, anything but a
+                    # single list there yields {}
+                    reader = _HashingReader(chunks)
+                    found = []
+                    async for item in ijson.items_async(
+                        reader, self._stream_prefix, use_float=True
+                    ):
+                        found.append(item)
+                    if len(found) == 1 and isinstance(found[0], list):
+                        data = found[0]
+                    else:
+                        data = {}
+                    content_hash = reader.hasher.intdigest()
+                    if content_hash == self._prev_hash:
+                        return _UNCHANGED
+                else:
+                    hasher = xxhash.xxh3_64()
+                    body = bytearray()
+                    async for chunk in chunks:
+                        hasher.update(chunk)
+                        body.extend(chunk)
+                    content_hash = hasher.intdigest()
+                    if content_hash == self._prev_hash:
+                        return _UNCHANGED
+                    data = orjson.loads(body)
+                self._prev_hash = content_hash
+                return data
+        except httpx.HTTPError as e:
             console.print(f"[red]Error fetching JSON:[/red] {e}")
             return None
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ijson.JSONError) as e:
             console.print(f"[red]Error parsing JSON:[/red] {e}")
             return None
 
@@ -83,127 +343,266 @@ class JSONDiffWatcher:
             data: JSON data to filter
 
         Returns:
-            Filtered JSON data
+            Filtered JSON data, or _BUDGET_EXCEEDED if the nested key search
+            hit max_nodes
         """
-        if not any([self.filter_path, self.filter_key]):
+        key = self.filter_key
+        value = self.filter_value
+        if not (self._path_ops or key):
             return data
 
         result = data
 
-        # Apply JSONPath-like filtering
-        if self.filter_path:
-            result = self._apply_path_filter(result, self.filter_path)
+        # Apply JSONPath-like filtering, unless fetch_json already streamed
+        # out just the selected items
+        if self._path_ops and self._stream_prefix is None:
+            result = self._apply_path_filter(result)
 
         # Apply key-value filtering
-        if self.filter_key and isinstance(result, list):
-            filtered = []
-            for item in result:
-                if isinstance(item, dict) and self.filter_key in item:
-                    if (
-                        self.filter_value is None
-                        or str(item[self.filter_key]) == self.filter_value
-                    ):
-                        filtered.append(item)
-            result = filtered
-        elif self.filter_key and isinstance(result, dict):
-            if self.filter_key in result:
-                if (
-                    self.filter_value is None
-                    or str(result[self.filter_key]) == self.filter_value
-                ):
-                    result = {self.filter_key: result[self.filter_key]}
+        if key and isinstance(result, list):
+            result = [
+                item
+                for item in result
+                if isinstance(item, dict)
+                and key in item
+                and (value is None or str(item[key]) == value)
+            ]
+        elif key and isinstance(result, dict):
+            if key in result:
+                if value is None or str(result[key]) == value:
+                    result = {key: result[key]}
                 else:
                     result = {}
             else:
                 # Try to find the key in nested structures
-                result = self._find_and_filter_key(
-                    result, self.filter_key, self.filter_value
-                )
+                result = self._find_and_filter_key(result, key, value, self.max_nodes)
 
         return result
 
-    def _apply_path_filter(self, data: Any, path: str) -> Any:
-        """Apply a simple JSONPath-like filter.
+    @staticmethod
+    def _compile_path(path: str) -> list:
+        """Compile a JSONPath-like path into a list of lookup operations.
 
         Args:
-            data: JSON data
             path: Path like 'items[*]' or 'data.items[0]'
 
         Returns:
-            Filtered data
-        """
-        parts = path.split(".")
-        result = data
+            List of (key, index) tuples. key is None when there is no key
+            to look up, index is None for plain keys, '*' for all items or
+            an int
 
-        for part in parts:
+        Raises:
+            ValueError: If a list index is neither '*' nor an integer
+        """
+        ops = []
+        for part in path.split("."):
             if "[" in part and "]" in part:
-                key = part[: part.index("[")]
-                index_part = part[part.index("[") + 1 : part.index("]")]
-                if key:
-                    result = result.get(key, {})
+                start = part.index("[")
+                index_part = part[start + 1 : part.index("]")]
                 if index_part == "*":
-                    # Return all items in list
-                    if isinstance(result, list):
-                        continue
-                    else:
-                        return {}
+                    index: Union[int, str] = "*"
                 else:
                     try:
-                        idx = int(index_part)
-                        if isinstance(result, list) and 0 <= idx < len(result):
-                            result = result[idx]
-                        else:
-                            return {}
+                        index = int(index_part)
                     except ValueError:
-                        return {}
+                        raise ValueError(
+                            f"Invalid index '{index_part}' in filter path '{path}'"
+                        ) from None
+                ops.append((part[:start] or None, index))
             else:
-                if isinstance(result, dict):
-                    result = result.get(part, {})
-                else:
+                ops.append((part, None))
+        return ops
+
+    @staticmethod
+    def _ijson_prefix(ops: list) -> Optional[str]:
+        """Translate compiled path ops into an ijson prefix, if possible.
+
+        Only paths made of plain keys and ending in '[*]' (e.g. 'items[*]'
+        or 'data.items[*]') can be streamed. The prefix selects the list
+        itself, so a missing or non-list value can be told from an empty one.
+        Keys named 'item' (ijson's name for array elements) or containing
+        '.' (its separator) cannot be expressed as a prefix and fall back to
+        parsing the whole document.
+
+        Args:
+            ops: Compiled path operations
+
+        Returns:
+            ijson prefix like 'data.items' ('' for the root), or None
+        """
+        if not ops or ops[-1][1] != "*":
+            return None
+        parts = []
+        for key, index in ops[:-1]:
+            if index is not None or not key:
+                return None
+            parts.append(key)
+        if ops[-1][0] is not None:
+            parts.append(ops[-1][0])
+        if any(part == "item" or "." in part for part in parts):
+            return None
+        return ".".join(parts)
+
+    def _apply_path_filter(self, data: Any) -> Any:
+        """Apply the compiled JSONPath-like filter.
+
+        Args:
+            data: JSON data
+
+        Returns:
+            Filtered data
+        """
+        result = data
+
+        for key, index in self._path_ops:
+            if key is not None:
+                if not isinstance(result, dict):
                     return {}
+                result = result.get(key, {})
+            if index is None:
+                continue
+            if index == "*":
+                # Return all items in list
+                if not isinstance(result, list):
+                    return {}
+            elif isinstance(result, list) and 0 <= index < len(result):
+                result = result[index]
+            else:
+                return {}
 
         return result
 
-    def _find_and_filter_key(self, data: Any, key: str, value: Optional[str]) -> Any:
-        """Recursively find and filter by key.
+    def _find_and_filter_key(
+        self,
+        data: Any,
+        key: str,
+        value: Optional[str],
+        max_nodes: Optional[int] = None,
+    ) -> Any:
+        """Find and filter by key anywhere in a nested structure.
+
+        Walks the tree depth-first with an explicit stack of child iterators
+        rather than recursion, without descending into objects that already
+        matched, so matches come out in document order. The pruned copy is
+        built during the walk: a container's copy is only created, and
+        attached to its parent's copy, once the first match below it is
+        found, so subtrees without matches leave nothing behind.
 
         Args:
             data: JSON data
             key: Key to find
             value: Optional value to match
+            max_nodes: Optional cap on the number of objects and lists visited
 
         Returns:
-            Filtered data
+            Filtered data, None if nothing matched, or _BUDGET_EXCEEDED if
+            max_nodes ran out
         """
+        if max_nodes == 0:
+            return self._give_up_search(key, max_nodes)
         if isinstance(data, dict):
-            if key in data:
-                if value is None or str(data[key]) == value:
-                    return {key: data[key]}
-            result = {}
-            for k, v in data.items():
-                filtered = self._find_and_filter_key(v, key, value)
-                if filtered:
-                    result[k] = filtered
-            return result if result else None
+            if key in data and (value is None or str(data[key]) == value):
+                return {key: data[key]}
+            root = [iter(data.items()), None, True, None, None]
         elif isinstance(data, list):
-            result = []
-            for item in data:
-                filtered = self._find_and_filter_key(item, key, value)
-                if filtered:
-                    result.append(filtered)
-            return result if result else None
-        return None
+            root = [enumerate(data), None, False, None, None]
+        else:
+            return None
+
+        # Frames are [children, pruned copy or None, is_dict, parent, slot]
+        budget = -1 if max_nodes is None else max_nodes - 1
+        pending = deque([root])
+        while pending:
+            frame = pending[-1]
+            for slot, child in frame[0]:
+                if isinstance(child, dict):
+                    is_dict = True
+                elif isinstance(child, list):
+                    is_dict = False
+                else:
+                    continue
+                if budget == 0:
+                    return self._give_up_search(key, max_nodes)
+                budget -= 1
+                if not (
+                    is_dict
+                    and key in child
+                    and (value is None or str(child[key]) == value)
+                ):
+                    children = iter(child.items()) if is_dict else enumerate(child)
+                    pending.append([children, None, is_dict, frame, slot])
+                    break
+
+                # Attach the match, creating missing ancestor copies
+                leaf = {key: child[key]}
+                parent = frame
+                while True:
+                    out = parent[1]
+                    created = out is None
+                    if created:
+                        out = parent[1] = {} if parent[2] else []
+                    if parent[2]:
+                        out[slot] = leaf
+                    else:
+                        out.append(leaf)
+                    if not created or parent[3] is None:
+                        break
+                    leaf, slot, parent = out, parent[4], parent[3]
+            else:
+                pending.pop()
+
+        return root[1]
+
+    def _give_up_search(self, key: str, max_nodes: int) -> Any:
+        """Warn, once, that the nested key search ran out of nodes.
+
+        Args:
+            key: Key being searched for
+            max_nodes: Node budget that ran out
+
+        Returns:
+            _BUDGET_EXCEEDED
+        """
+        if not self._budget_warned:
+            self._budget_warned = True
+            console.print(
+                f"[yellow]Warning: Gave up searching for '{key}' "
+                f"after {max_nodes} nodes; skipping such updates[/yellow]"
+            )
+        return _BUDGET_EXCEEDED
 
     def save_previous(self, data: Any):
-        """Save previous data to file for persistence.
+        """Queue previous data to be saved to file for persistence.
 
         Args:
             data: Data to save
         """
+        try:
+            self._write_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._write_q.put_nowait(data)
+
+    def _writer_loop(self):
+        """Write queued snapshots to the cache file until told to stop."""
+        while True:
+            data = self._write_q.get()
+            if data is _STOP:
+                return
+            self._write_previous(data)
+
+    def _write_previous(self, data: Any):
+        """Atomically replace the cache file with data.
+
+        Args:
+            data: Data to save
+        """
+        tmp_file = self.storage_file.with_suffix(".tmp")
         try:
             self.storage_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.storage_file, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, self.storage_file)
         except Exception as e:
             console.print(
                 f"[yellow]Warning: Could not save previous data:[/yellow] {e}"
@@ -217,8 +616,8 @@ class JSONDiffWatcher:
         """
         try:
             if self.storage_file.exists():
-                with open(self.storage_file, "r") as f:
-                    return json.load(f)
+                with open(self.storage_file, "rb") as f:
+                    return orjson.loads(f.read())
         except Exception as e:
             console.print(
                 f"[yellow]Warning: Could not load previous data:[/yellow] {e}"
@@ -237,134 +636,395 @@ class JSONDiffWatcher:
         if not diff:
             return ""
 
-        output_lines = []
-        output_lines.append("[bold cyan]Changes detected:[/bold cyan]\n")
+        buf = io.StringIO()
+        buf.write("[bold cyan]Changes detected:[/bold cyan]\n")
 
         # Dictionary items added
         if "dictionary_item_added" in diff:
-            output_lines.append("[green]Added items:[/green]")
-            for item in diff["dictionary_item_added"]:
-                output_lines.append(f"  [green]+[/green] {item}")
-            output_lines.append("")
+            buf.write("\n[green]Added items:[/green]\n")
+            buf.write(
+                "".join(
+                    f"  [green]+[/green] {item}\n"
+                    for item in diff["dictionary_item_added"]
+                )
+            )
 
         # Dictionary items removed
         if "dictionary_item_removed" in diff:
-            output_lines.append("[red]Removed items:[/red]")
-            for item in diff["dictionary_item_removed"]:
-                output_lines.append(f"  [red]-[/red] {item}")
-            output_lines.append("")
+            buf.write("\n[red]Removed items:[/red]\n")
+            buf.write(
+                "".join(
+                    f"  [red]-[/red] {item}\n"
+                    for item in diff["dictionary_item_removed"]
+                )
+            )
 
         # Values changed
         if "values_changed" in diff:
-            output_lines.append("[yellow]Changed values:[/yellow]")
-            for path, change in diff["values_changed"].items():
-                old_val = change.get("old_value", "N/A")
-                new_val = change.get("new_value", "N/A")
-                output_lines.append(f"  [yellow]~[/yellow] {path}")
-                output_lines.append(f"    [red]-[/red] {old_val}")
-                output_lines.append(f"    [green]+[/green] {new_val}")
-            output_lines.append("")
+            buf.write("\n[yellow]Changed values:[/yellow]\n")
+            buf.write(
+                "".join(
+                    f"  [yellow]~[/yellow] {path}\n"
+                    f"    [red]-[/red] {change.get('old_value', 'N/A')}\n"
+                    f"    [green]+[/green] {change.get('new_value', 'N/A')}\n"
+                    for path, change in diff["values_changed"].items()
+                )
+            )
 
         # Items added to list
         if "iterable_item_added" in diff:
-            output_lines.append("[green]Items added to list:[/green]")
-            for path, value in diff["iterable_item_added"].items():
-                output_lines.append(f"  [green]+[/green] {path}: {value}")
-            output_lines.append("")
+            buf.write("\n[green]Items added to list:[/green]\n")
+            buf.write(
+                "".join(
+                    f"  [green]+[/green] {path}: {value}\n"
+                    for path, value in diff["iterable_item_added"].items()
+                )
+            )
 
         # Items removed from list
         if "iterable_item_removed" in diff:
-            output_lines.append("[red]Items removed from list:[/red]")
-            for path, value in diff["iterable_item_removed"].items():
-                output_lines.append(f"  [red]-[/red] {path}: {value}")
-            output_lines.append("")
+            buf.write("\n[red]Items removed from list:[/red]\n")
+            buf.write(
+                "".join(
+                    f"  [red]-[/red] {path}: {value}\n"
+                    for path, value in diff["iterable_item_removed"].items()
+                )
+            )
 
-        return "\n".join(output_lines)
+        if diff.get_stats().get("MAX DIFF LIMIT REACHED"):
+            buf.write(
+                f"\n[yellow]Stopped after {MAX_DIFFS} differences; "
+                "more changes are not shown[/yellow]\n"
+            )
 
-    def display_diff(self, current: Any, previous: Any):
+        return buf.getvalue()
+
+    def format_patch(self, patch: jsonpatch.JsonPatch, previous: Any) -> str:
+        """Format a JSON Patch (RFC 6902) for display.
+
+        Args:
+            patch: JsonPatch object
+            previous: Data the patch applies to, used to show old values
+
+        Returns:
+            Formatted diff string
+        """
+        if not patch:
+            return ""
+
+        # Each op's path refers to the document as left by the ops before
+        # it, so old values are looked up while replaying the patch
+        doc = copy.deepcopy(previous)
+        added, removed, replaced, moved = [], [], [], []
+        for op in patch:
+            path = op["path"] or "/"
+            if op["op"] == "add":
+                added.append((path, op["value"]))
+            elif op["op"] == "remove":
+                removed.append((path, resolve_pointer(doc, op["path"])))
+            elif op["op"] == "replace":
+                replaced.append((path, resolve_pointer(doc, op["path"]), op["value"]))
+            else:
+                moved.append((op["from"] or "/", path, op["op"]))
+            doc = jsonpatch.apply_patch(doc, [op], in_place=True)
+
+        buf = io.StringIO()
+        buf.write("[bold cyan]Changes detected:[/bold cyan]\n")
+
+        if added:
+            buf.write("\n[green]Added items:[/green]\n")
+            buf.write(
+                "".join(
+                    f"  [green]+[/green] {path}: {value}\n" for path, value in added
+                )
+            )
+
+        if removed:
+            buf.write("\n[red]Removed items:[/red]\n")
+            buf.write(
+                "".join(f"  [red]-[/red] {path}: {value}\n" for path, value in removed)
+            )
+
+        if replaced:
+            buf.write("\n[yellow]Changed values:[/yellow]\n")
+            buf.write(
+                "".join(
+                    f"  [yellow]~[/yellow] {path}\n"
+                    f"    [red]-[/red] {old}\n"
+                    f"    [green]+[/green] {new}\n"
+                    for path, old, new in replaced
+                )
+            )
+
+        if moved:
+            buf.write("\n[yellow]Moved items:[/yellow]\n")
+            buf.write(
+                "".join(
+                    f"  [yellow]~[/yellow] {source} -> {path} ({kind})\n"
+                    for source, path, kind in moved
+                )
+            )
+
+        return buf.getvalue()
+
+    def format_keyed_diff(self, added: list, removed: list, changed: list) -> str:
+        """Format a diff of records matched by filter_key for display.
+
+        Args:
+            added: Records only in the current data
+            removed: Records only in the previous data
+            changed: (old, new) pairs of records that differ
+
+        Returns:
+            Formatted diff string
+        """
+        if not (added or removed or changed):
+            return ""
+
+        key = self.filter_key
+        buf = io.StringIO()
+        buf.write("[bold cyan]Changes detected:[/bold cyan]\n")
+
+        if added:
+            buf.write("\n[green]Added records:[/green]\n")
+            buf.write(
+                "".join(
+                    f"  [green]+[/green] {key}={record[key]}: {record}\n"
+                    for record in added
+                )
+            )
+
+        if removed:
+            buf.write("\n[red]Removed records:[/red]\n")
+            buf.write(
+                "".join(
+                    f"  [red]-[/red] {key}={record[key]}: {record}\n"
+                    for record in removed
+                )
+            )
+
+        if changed:
+            buf.write("\n[yellow]Changed records:[/yellow]\n")
+            buf.write(
+                "".join(
+                    f"  [yellow]~[/yellow] {key}={new[key]}\n"
+                    f"    [red]-[/red] {old}\n"
+                    f"    [green]+[/green] {new}\n"
+                    for old, new in changed
+                )
+            )
+
+        return buf.getvalue()
+
+    def _emit_patch(self, previous_filtered: Any, current_filtered: Any) -> bool:
+        """Write the change as a JSON Patch to stdout, bypassing Rich.
+
+        The initial data is emitted as a patch replacing the whole document.
+        Every record carries the watched URL and a per-watcher change number
+        ("seq"), so output from several watchers can be told apart and ndjson
+        lines can be grouped back into patches.
+
+        Args:
+            previous_filtered: Filtered previous data, None on first load
+            current_filtered: Filtered current data
+
+        Returns:
+            False if nothing changed since the previous data, True otherwise
+        """
+        if previous_filtered is not None and current_filtered == previous_filtered:
+            return False
+        patch = jsonpatch.make_patch(previous_filtered, current_filtered).patch
+        if not patch:
+            return False
+
+        self._seq += 1
+        if self.output_format == "ndjson":
+            # Extra members are ignored by RFC 6902, so each line stays a
+            # valid patch operation
+            out = b"".join(
+                orjson.dumps({**op, "url": self.url, "seq": self._seq}) + b"\n"
+                for op in patch
+            )
+        else:
+            record = {"url": self.url, "seq": self._seq, "patch": patch}
+            out = orjson.dumps(record) + b"\n"
+        sys.stdout.buffer.write(out)
+        sys.stdout.buffer.flush()
+        return True
+
+    def display_diff(self, current: Any, previous: Any) -> Optional[bool]:
         """Display the difference between current and previous data.
 
         Args:
             current: Current JSON data
             previous: Previous JSON data
+
+        Returns:
+            False if nothing changed since the previous data, True otherwise,
+            or None if the update could not be filtered and was skipped
         """
         # Filter both if needed
         current_filtered = self.filter_json(current)
-        previous_filtered = self.filter_json(previous) if previous else None
+        if current_filtered is _BUDGET_EXCEEDED:
+            return None
+        # The previous side was already filtered on the last call; only filter
+        # it here on the first comparison (e.g. data loaded from the cache)
+        if self.previous_filtered is not None:
+            previous_filtered = self.previous_filtered
+        else:
+            previous_filtered = self.filter_json(previous) if previous else None
+            if previous_filtered is _BUDGET_EXCEEDED:
+                # Nothing to compare against; show current as initial data
+                previous_filtered = None
+        self.previous_filtered = current_filtered
+
+        if self.output_format != "rich":
+            return self._emit_patch(previous_filtered, current_filtered)
+
+        prev_str = self._previous_pretty
+        self._previous_pretty = None
 
         # Calculate diff
         if previous_filtered is None:
+            curr_str = orjson.dumps(
+                current_filtered, option=orjson.OPT_INDENT_2
+            ).decode()
+            self._previous_pretty = curr_str
             console.print(
                 Panel(
                     Group(
                         Text("Initial data loaded", style="green"),
-                        Syntax(
-                            json.dumps(current_filtered, indent=2),
-                            "json",
-                            theme="monokai",
-                        ),
+                        Syntax(curr_str, "json", theme="monokai"),
                     ),
                     title="[bold]JSON Watch[/bold]",
+                    subtitle=f"[dim]{self.url}[/dim]",
                     border_style="green",
                 )
             )
-            return
-
-        diff = DeepDiff(
-            previous_filtered, current_filtered, ignore_order=False, verbose_level=2
-        )
+            return True
 
-        if not diff:
+        # Plain equality is far cheaper than DeepDiff and stops at the first
+        # difference, which covers the common nothing-changed poll
+        if current_filtered == previous_filtered:
+            self._previous_pretty = prev_str
             console.print("[dim]No changes detected.[/dim]")
-            return
+            return False
+
+        keyed = None
+        if (
+            self.schema == "list-by-key"
+            and isinstance(previous_filtered, list)
+            and isinstance(current_filtered, list)
+        ):
+            keyed = diff_list_by_key(
+                previous_filtered, current_filtered, self.filter_key
+            )
 
-        # Show only diffs or full comparison
-        if self.show_only_diffs:
+        if keyed is not None:
+            # Records matched by key need no generic tree diff at all
+            if not any(keyed):
+                console.print("[dim]No changes detected.[/dim]")
+                return False
+            diff_text = self.format_keyed_diff(*keyed)
+        elif self.show_only_diffs:
+            # A flat JSON Patch is all the diff-only view needs, and is much
+            # cheaper to compute than DeepDiff's full change report
+            patch = jsonpatch.make_patch(previous_filtered, current_filtered)
+            if not patch:
+                console.print("[dim]No changes detected.[/dim]")
+                return False
+            diff_text = self.format_patch(patch, previous_filtered)
+        else:
+            diff = DeepDiff(
+                previous_filtered,
+                current_filtered,
+                ignore_order=False,
+                verbose_level=2,
+                max_diffs=MAX_DIFFS,
+                cache_size=5000,
+                cutoff_intersection_for_pairs=1.0,
+            )
+            if not diff:
+                console.print("[dim]No changes detected.[/dim]")
+                return False
             diff_text = self.format_diff(diff)
+
+        if self.show_only_diffs:
             console.print(
                 Panel(
                     diff_text,
                     title="[bold]JSON Differences[/bold]",
+                    subtitle=f"[dim]{self.url}[/dim]",
                     border_style="yellow",
                 )
             )
-        else:
-            # Show side-by-side comparison
-            table = Table(
-                box=box.ROUNDED, show_header=True, header_style="bold magenta"
+            return True
+
+        # Show side-by-side comparison
+        table = Table(box=box.ROUNDED, show_header=True, header_style="bold magenta")
+        table.add_column("Previous", style="red", width=40)
+        table.add_column("Current", style="green", width=40)
+
+        # The previous side is usually what the last call serialized
+        if prev_str is None:
+            prev_str = orjson.dumps(
+                previous_filtered, option=orjson.OPT_INDENT_2
+            ).decode()
+        curr_str = orjson.dumps(current_filtered, option=orjson.OPT_INDENT_2).decode()
+        self._previous_pretty = curr_str
+
+        # Split into lines and align them, collapsing long unchanged runs
+        prev_lines = prev_str.split("\n")
+        curr_lines = curr_str.split("\n")
+        matcher = difflib.SequenceMatcher(None, prev_lines, curr_lines)
+
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal" and i2 - i1 > COLLAPSE_EQUAL_LINES:
+                collapsed = Text(f"... {i2 - i1} unchanged lines ...", style="dim")
+                table.add_row(collapsed, collapsed)
+                continue
+            for prev_line, curr_line in itertools.zip_longest(
+                prev_lines[i1:i2], curr_lines[j1:j2], fillvalue=""
+            ):
+                table.add_row(prev_line, curr_line)
+
+        console.print(
+            Panel(
+                table,
+                title="[bold]JSON Comparison[/bold]",
+                subtitle=f"[dim]{self.url}[/dim]",
+                border_style="cyan",
             )
-            table.add_column("Previous", style="red", width=40)
-            table.add_column("Current", style="green", width=40)
+        )
 
-            prev_str = json.dumps(previous_filtered, indent=2)
-            curr_str = json.dumps(current_filtered, indent=2)
+        # Also show the formatted diff
+        if diff_text:
+            console.print(
+                Panel(
+                    diff_text,
+                    title="[bold]Changes Summary[/bold]",
+                    border_style="yellow",
+                )
+            )
 
-            # Split into lines for comparison
-            prev_lines = prev_str.split("\n")
-            curr_lines = curr_str.split("\n")
-            max_lines = max(len(prev_lines), len(curr_lines))
+        return True
 
-            for i in range(max_lines):
-                prev_line = prev_lines[i] if i < len(prev_lines) else ""
-                curr_line = curr_lines[i] if i < len(curr_lines) else ""
-                table.add_row(prev_line, curr_line)
+    def close(self):
+        """Write any pending snapshot and stop the cache writer thread."""
+        if self._writer.is_alive():
+            self._write_q.put(_STOP)
+            self._writer.join()
 
-            console.print(
-                Panel(table, title="[bold]JSON Comparison[/bold]", border_style="cyan")
-            )
+    async def aclose(self):
+        """Flush the cache and release the pooled HTTP connections.
 
-            # Also show the formatted diff
-            diff_text = self.format_diff(diff)
-            if diff_text:
-                console.print(
-                    Panel(
-                        diff_text,
-                        title="[bold]Changes Summary[/bold]",
-                        border_style="yellow",
-                    )
-                )
+        The HTTP client is left open if it is shared with other watchers.
+        """
+        await asyncio.to_thread(self.close)
+        if self._owns_client:
+            await self._client.aclose()
 
-    def run(self):
+    async def run(self):
         """Run the watcher loop."""
         console.print(f"[bold cyan]Watching JSON from:[/bold cyan] {self.url}")
         console.print(f"[dim]Interval: {self.interval} seconds[/dim]")
@@ -377,25 +1037,54 @@ class JSONDiffWatcher:
         # Load previous data if exists
         self.previous_data = self.load_previous()
 
-        try:
-            while True:
-                current_data = self.fetch_json()
-                if current_data is None:
-                    time.sleep(self.interval)
-                    continue
+        while True:
+            current_data = await self.fetch_json()
+            if current_data is None:
+                await asyncio.sleep(self.interval)
+                continue
 
+            if current_data is _UNCHANGED:
+                if self.output_format == "rich":
+                    console.print("[dim]No changes detected.[/dim]")
+                changed = False
+            else:
                 if self.previous_data is not None:
-                    self.display_diff(current_data, self.previous_data)
+                    changed = self.display_diff(current_data, self.previous_data)
                 else:
                     # First run - just display initial data
-                    self.display_diff(current_data, None)
+                    changed = self.display_diff(current_data, None)
 
-                self.previous_data = current_data
-                self.save_previous(current_data)
+                if changed is None:
+                    # Keep comparing against the last update we could filter
+                    changed = False
+                else:
+                    self.previous_data = current_data
+                    self.save_previous(current_data)
 
-                time.sleep(self.interval)
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Stopped by user[/yellow]")
+            # Back off while idle, unless a long-polling server already did
+            # the waiting for us
+            if changed or self._server_waited:
+                self._idle_multiplier = 1
+            else:
+                self._idle_multiplier = min(
+                    self._max_multiplier, self._idle_multiplier * 2
+                )
+            await asyncio.sleep(self.interval * self._idle_multiplier)
+
+
+async def main_async(watchers: list, client: httpx.AsyncClient):
+    """Run several watchers concurrently on a shared HTTP client.
+
+    Args:
+        watchers: Watchers to run
+        client: HTTP client shared by the watchers, closed on exit
+    """
+    async with client:
+        try:
+            await asyncio.gather(*(watcher.run() for watcher in watchers))
+        finally:
+            for watcher in watchers:
+                await watcher.aclose()
 
 
 def main():
@@ -417,12 +1106,15 @@ Examples:
   # Show only differences
   %(prog)s https://api.example.com/data --show-only-diffs
 
+  # Watch several URLs at once
+  %(prog)s https://api.example.com/data https://api.example.com/status
+
   # Custom interval and headers
   %(prog)s https://api.example.com/data -i 5 --header "Authorization: Bearer token"
         """,
     )
 
-    _ = parser.add_argument("url", help="URL to fetch JSON from")
+    _ = parser.add_argument("url", nargs="+", help="URL(s) to fetch JSON from")
     _ = parser.add_argument(
         "-i",
         "--interval",
@@ -459,9 +1151,47 @@ Examples:
         dest="headers",
         help='HTTP header to send (can be used multiple times, format: "Key: Value")',
     )
+    _ = parser.add_argument(
+        "--max-backoff",
+        type=int,
+        default=10,
+        help="Max interval multiplier while nothing changes, 1 disables (default: 10)",
+    )
+    _ = parser.add_argument(
+        "--max-nodes",
+        type=int,
+        default=None,
+        help="Max objects and lists to visit when searching nested data for "
+        "--filter-key (default: no limit)",
+    )
+    _ = parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="rich",
+        dest="output_format",
+        help="Output format: colored panels, one JSON Patch record per change "
+        "(json) or one patch operation per line (ndjson), tagged with the URL "
+        "and a change number (default: rich)",
+    )
+    _ = parser.add_argument(
+        "--schema",
+        choices=SCHEMAS,
+        default=None,
+        help="Known shape of the filtered data to diff it faster; "
+        '"list-by-key" matches list records by --filter-key',
+    )
+    _ = parser.add_argument(
+        "--long-poll",
+        action="store_true",
+        help="Ask the server to hold each request until the data changes",
+    )
 
     args = parser.parse_args()
 
+    # Keep stdout clean for the patches; status and errors go to stderr
+    if args.output_format != "rich":
+        console.stderr = True
+
     # Parse headers
     headers = {}
     if args.headers:
@@ -470,17 +1200,34 @@ Examples:
                 key, value = header.split(":", 1)
                 headers[key.strip()] = value.strip()
 
-    watcher = JSONDiffWatcher(
-        url=args.url,
-        interval=args.interval,
-        filter_path=args.filter_path,
-        filter_key=args.filter_key,
-        filter_value=args.filter_value,
-        show_only_diffs=args.show_only_diffs,
-        headers=headers,
-    )
-
-    watcher.run()
+    # All watchers share one connection pool
+    client = create_client()
+    try:
+        watchers = [
+            JSONDiffWatcher(
+                url=url,
+                interval=args.interval,
+                filter_path=args.filter_path,
+                filter_key=args.filter_key,
+                filter_value=args.filter_value,
+                show_only_diffs=args.show_only_diffs,
+                headers=headers,
+                max_backoff=args.max_backoff,
+                long_poll=args.long_poll,
+                client=client,
+                schema=args.schema,
+                max_nodes=args.max_nodes,
+                output_format=args.output_format,
+            )
+            for url in args.url
+        ]
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        asyncio.run(main_async(watchers, client))
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped by user[/yellow]")
 
 
 if __name__ == "__main__":